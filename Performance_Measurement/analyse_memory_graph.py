@@ -2,19 +2,54 @@
 
 import os
 import re
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
+
+
+_TS_LEN = len('YYYY-MM-DD HH:MM:SS.ffffff')
+_VALUE_RE = re.compile(r' (?:RAM: (?P<ram>\d+) kB|SWAP: (?P<swap>\d+) kB|RAM Peak: (?P<peak>\d+) kB)')
+_INIT_RE = re.compile(r'(?:Client|Server|TTP) Initialisation (Keys_Params|ZeroMQ) (Start|End)')
+_BATCH_RE = re.compile(
+    r'(?P<batch_start>Start Batch Processing|Batch Start)|(?P<batch_end>End Batch Processing|Batch End)'
+)
+_FILENAME_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_'
+    r'(HHE|HE)_BatchNr:(\d+)_BatchSize:(\d+)_IntSize:(\d+)_'
+    r'(client|server|ttp)_(HHE|HE)'
+)
+
+
+class MemoryViews(NamedTuple):
+    timestamps: np.ndarray
+    ram_mb: np.ndarray
+    swap_kb: np.ndarray
+    swap_mb: np.ndarray
+    is_batch: np.ndarray
+    seconds: np.ndarray
 
 
 @dataclass
 class MemoryData:
-    timestamps: List[datetime]
-    ram_mb: List[float]
-    swap_kb: List[float]
-    is_batch: List[bool]
+    timestamps: np.ndarray
+    ram_mb: np.ndarray
+    swap_kb: np.ndarray
+    is_batch: np.ndarray
     init_events: List[Tuple[float, str]] = None
     init_events_with_swap: List[Tuple[float, float, str]] = None
     max_ram_peak_mb: float = 0
@@ -26,6 +61,21 @@ class MemoryData:
             self.init_events = []
         if self.init_events_with_swap is None:
             self.init_events_with_swap = []
+    
+    # Returns the plotted samples (all but the last one) as NumPy arrays, computed once per data object.
+    @cached_property
+    def as_views(self) -> MemoryViews:
+        end = -1 if len(self.timestamps) > 1 else None
+        timestamps = self.timestamps[:end]
+        swap_kb = self.swap_kb[:end]
+        return MemoryViews(
+            timestamps=timestamps,
+            ram_mb=self.ram_mb[:end],
+            swap_kb=swap_kb,
+            swap_mb=swap_kb / 1024.0,
+            is_batch=self.is_batch[:end],
+            seconds=(timestamps - timestamps[0]) / np.timedelta64(1, 's')
+        )
 
 
 @dataclass
@@ -41,137 +91,110 @@ class FileMetadata:
 
 class LogParser:
     
-    INIT_PATTERNS = [
-        'Client Initialisation Keys_Params Start',
-        'Client Initialisation Keys_Params End',
-        'Client Initialisation ZeroMQ Start',
-        'Client Initialisation ZeroMQ End',
-        'Server Initialisation Keys_Params Start',
-        'Server Initialisation Keys_Params End',
-        'Server Initialisation ZeroMQ Start',
-        'Server Initialisation ZeroMQ End',
-        'TTP Initialisation Keys_Params Start',
-        'TTP Initialisation Keys_Params End',
-        'TTP Initialisation ZeroMQ Start',
-        'TTP Initialisation ZeroMQ End'
-    ]
-    
     # Parses a memory log file and returns all extracted measurements as a MemoryData object.
     def parse(self, filepath: str) -> MemoryData:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        measurements = defaultdict(dict)
+        ts_list = []
+        ram_list = []
+        swap_list = []
+        batch_list = []
+        cur_swap = 0
         in_batch = False
         current_init_event = None
         
-        max_ram_peak_kb = 0
-        peak_timestamp = None
+        peak_kb_list = []
+        peak_ts_list = []
         
         init_events = []
         init_events_with_swap = []
         
         initialized_timestamp = None
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            timestamp = self._extract_timestamp(line)
-            if not timestamp:
-                continue
-            
-            if " initialized" in line and not initialized_timestamp:
-                initialized_timestamp = timestamp
-            
-            init_event = self._check_init_event(line)
-            if init_event:
-                current_init_event = init_event
-            
-            if "Start Batch Processing" in line or "Batch Start" in line:
-                in_batch = True
-            elif "End Batch Processing" in line or "Batch End" in line:
-                in_batch = False
-            
-            measurements[timestamp]['batch'] = in_batch
-            
-            if "RAM:" in line and "RAM Peak:" not in line:
-                ram_kb = self._extract_value(line, r'RAM: (\d+) kB')
-                if ram_kb is not None:
-                    measurements[timestamp]['ram'] = ram_kb
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            for line in f:
+                if len(line) < _TS_LEN or line[4] != '-':
+                    continue
+                try:
+                    timestamp = datetime.fromisoformat(line[:_TS_LEN])
+                except ValueError:
+                    continue
+                
+                match = _VALUE_RE.match(line, _TS_LEN)
+                kind = match.lastgroup if match else None
+                
+                if kind is None:
+                    if " initialized" in line and not initialized_timestamp:
+                        initialized_timestamp = timestamp
+                    
+                    if 'Initialisation' in line:
+                        init_event = self._check_init_event(line)
+                        if init_event:
+                            current_init_event = init_event
+                    
+                    batch_match = _BATCH_RE.search(line)
+                    if batch_match:
+                        in_batch = batch_match.lastgroup == 'batch_start'
+                elif kind == 'ram':
+                    ram_kb = int(match.group('ram'))
+                    ts_list.append(line[:_TS_LEN])
+                    ram_list.append(ram_kb / 1024)
+                    swap_list.append(cur_swap)
+                    batch_list.append(in_batch)
                     
                     if current_init_event:
-                        swap_kb = measurements[timestamp].get('swap', 0)
                         init_events.append((ram_kb / 1024, current_init_event))
-                        init_events_with_swap.append((ram_kb / 1024, swap_kb, current_init_event))
+                        init_events_with_swap.append((ram_kb / 1024, cur_swap, current_init_event))
                         current_init_event = None
-            
-            if "SWAP:" in line:
-                swap_kb = self._extract_value(line, r'SWAP: (\d+) kB')
-                if swap_kb is not None:
-                    measurements[timestamp]['swap'] = swap_kb
-            
-            if "RAM Peak:" in line:
-                peak_kb = self._extract_value(line, r'RAM Peak: (\d+) kB')
-                if peak_kb and peak_kb > max_ram_peak_kb:
-                    max_ram_peak_kb = peak_kb
-                    peak_timestamp = timestamp
+                elif kind == 'swap':
+                    cur_swap = int(match.group('swap'))
+                elif kind == 'peak':
+                    peak_kb_list.append(int(match.group('peak')))
+                    peak_ts_list.append(timestamp)
+        
+        max_ram_peak_kb = 0
+        peak_timestamp = None
+        if peak_kb_list:
+            peak_index = int(np.argmax(peak_kb_list))
+            if peak_kb_list[peak_index] > 0:
+                max_ram_peak_kb = peak_kb_list[peak_index]
+                peak_timestamp = peak_ts_list[peak_index]
         
         return self._build_memory_data(
-            measurements, init_events, init_events_with_swap, max_ram_peak_kb, peak_timestamp, initialized_timestamp
+            ts_list, ram_list, swap_list, batch_list, init_events, init_events_with_swap,
+            max_ram_peak_kb, peak_timestamp, initialized_timestamp
         )
     
-    # Extracts and returns the datetime timestamp from a single log line.
-    def _extract_timestamp(self, line: str) -> Optional[datetime]:
-        match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+)', line)
-        if match:
-            return datetime.fromisoformat(match.group(1))
-        return None
-    
-    # Extracts and returns a numeric value from a log line using the given regex pattern.
-    def _extract_value(self, line: str, pattern: str) -> Optional[int]:
-        match = re.search(pattern, line)
-        return int(match.group(1)) if match else None
-    
     # Checks whether a log line contains a known initialization event and returns its type.
     def _check_init_event(self, line: str) -> Optional[str]:
-        for pattern in self.INIT_PATTERNS:
-            if pattern in line:
-                if 'Keys_Params' in pattern:
-                    return 'keys_params'
-                elif 'ZeroMQ Start' in pattern:
-                    return 'zeromq_start'
-                elif 'ZeroMQ End' in pattern:
-                    return 'zeromq_end'
-        return None
+        match = _INIT_RE.search(line)
+        if not match:
+            return None
+        
+        kind, phase = match.groups()
+        if kind == 'Keys_Params':
+            return 'keys_params'
+        return 'zeromq_start' if phase == 'Start' else 'zeromq_end'
     
-    # Assembles and returns a MemoryData object from the parsed measurement dictionaries and event lists.
-    def _build_memory_data(self, measurements: dict, init_events: List, init_events_with_swap: List,
+    # Assembles and returns a MemoryData object from the time-ordered sample lists, dropping samples taken before initialization.
+    def _build_memory_data(self, ts_strings: List[str], ram_mb: List, swap_kb: List, is_batch: List,
+                          init_events: List, init_events_with_swap: List,
                           max_ram_peak_kb: int, peak_timestamp, initialized_timestamp) -> MemoryData:
-        sorted_times = sorted(measurements.keys())
-        
-        timestamps = []
-        ram_mb = []
-        swap_kb = []
-        is_batch = []
-        
-        for ts in sorted_times:
-            if initialized_timestamp and ts < initialized_timestamp:
-                continue
-                
-            m = measurements[ts]
-            if 'ram' in m:
-                timestamps.append(ts)
-                ram_mb.append(m['ram'] / 1024)
-                swap_kb.append(m.get('swap', 0))
-                is_batch.append(m.get('batch', False))
+        timestamps = np.array(ts_strings, dtype='datetime64[us]')
+        ram_arr = np.array(ram_mb, dtype=np.float64)
+        swap_arr = np.array(swap_kb, dtype=np.float64)
+        batch_arr = np.array(is_batch, dtype=bool)
+        
+        if initialized_timestamp:
+            mask = timestamps >= np.datetime64(initialized_timestamp, 'us')
+            timestamps = timestamps[mask]
+            ram_arr = ram_arr[mask]
+            swap_arr = swap_arr[mask]
+            batch_arr = batch_arr[mask]
         
         return MemoryData(
             timestamps=timestamps,
-            ram_mb=ram_mb,
-            swap_kb=swap_kb,
-            is_batch=is_batch,
+            ram_mb=ram_arr,
+            swap_kb=swap_arr,
+            is_batch=batch_arr,
             init_events=init_events,
             init_events_with_swap=init_events_with_swap,
             max_ram_peak_mb=max_ram_peak_kb / 1024,
@@ -185,31 +208,33 @@ class GraphPlotter:
     # Initializes the plotter with the target Raspberry Pi type for time axis scaling.
     def __init__(self, pi_type: str = "3b"):
         self.pi_type = pi_type
+        self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        self.fig.subplots_adjust(left=0.08, right=0.98, bottom=0.1, top=0.93)
+    
+    # Releases the figure shared by all plots of this plotter.
+    def close(self):
+        plt.close(self.fig)
     
     # Generates and saves a scatter plot of RAM usage over time for the given component.
     def plot_ram(self, data: MemoryData, metadata: FileMetadata, output_path: str):
-        plt.figure(figsize=(12, 6))
+        ax = self.ax
+        ax.clear()
         
-        ram = data.ram_mb[:-1] if len(data.ram_mb) > 1 else data.ram_mb
-        times = data.timestamps[:-1] if len(data.timestamps) > 1 else data.timestamps
-        batches = data.is_batch[:-1] if len(data.is_batch) > 1 else data.is_batch
-        
-        start_time = times[0]
-        seconds = [(t - start_time).total_seconds() for t in times]
+        v = data.as_views
+        ram, batches, seconds = v.ram_mb, v.is_batch, v.seconds
         
         time_data, xlabel = self._prepare_time_axis(seconds, metadata)
         
-        for t in time_data:
-            plt.axvline(x=t, color='gray', linestyle='-', linewidth=0.5, alpha=0.3, zorder=1)
+        self._add_vertical_lines(time_data, color='gray', linewidth=0.5, alpha=0.3, zorder=1)
         
-        plt.scatter(time_data, ram, color='blue', s=20, alpha=0.8)
+        ax.scatter(time_data, ram, color='blue', s=20, alpha=0.8, rasterized=True)
         
         if data.init_events:
             self._add_init_markers(data.init_events)
         
         if (data.max_ram_peak_mb > 0 and metadata.component == 'ttp' 
             and metadata.variant == 'HHE'):
-            self._add_peak_marker(data, start_time, time_data, times, metadata)
+            self._add_peak_marker(data, time_data, seconds, metadata)
         
         self._fill_background(time_data, ram, batches, 'blue')
         
@@ -218,33 +243,29 @@ class GraphPlotter:
             xlabel, "RAM Usage (MB)"
         )
         
-        plt.ylim(bottom=0)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_ylim(bottom=0)
+        self.fig.savefig(output_path, dpi=300, pil_kwargs={'compress_level': 1})
     
     # Generates and saves a scatter plot of SWAP usage over time, with special unit scaling for client HE.
     def plot_swap(self, data: MemoryData, metadata: FileMetadata, output_path: str):
-        plt.figure(figsize=(12, 6))
+        ax = self.ax
+        ax.clear()
         
-        swap = data.swap_kb[:-1] if len(data.swap_kb) > 1 else data.swap_kb
-        times = data.timestamps[:-1] if len(data.timestamps) > 1 else data.timestamps
-        batches = data.is_batch[:-1] if len(data.is_batch) > 1 else data.is_batch
+        v = data.as_views
+        swap, batches, seconds = v.swap_kb, v.is_batch, v.seconds
         
         ylabel = "SWAP Usage (kB)"
         if metadata.component == 'client' and metadata.variant == 'HE':
             if self.pi_type == "3b":
-                swap = [s * 1024 for s in swap]
+                swap = swap * 1024
                 ylabel = "SWAP Usage (Bytes)"
             elif self.pi_type == "zero":
-                swap = [s / 1024 for s in swap]
+                swap = v.swap_mb
                 ylabel = "SWAP Usage (MB)"
         
-        start_time = times[0]
-        seconds = [(t - start_time).total_seconds() for t in times]
-        
         time_data, xlabel = self._prepare_time_axis(seconds, metadata)
         
-        plt.scatter(time_data, swap, color='orange', s=20, alpha=0.8)
+        ax.scatter(time_data, swap, color='orange', s=20, alpha=0.8, rasterized=True)
         
         self._fill_background(time_data, swap, batches, 'orange')
         
@@ -253,112 +274,91 @@ class GraphPlotter:
             xlabel, ylabel
         )
         
-        plt.ylim(bottom=0)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_ylim(bottom=0)
+        self.fig.savefig(output_path, dpi=300, pil_kwargs={'compress_level': 1})
     
     # Generates and saves a stacked area graph of combined RAM and SWAP usage, intended for client HE.
     def plot_stacked_ram_swap(self, data: MemoryData, metadata: FileMetadata, output_path: str):
-        plt.figure(figsize=(12, 6))
-        
-        ram = data.ram_mb[:-1] if len(data.ram_mb) > 1 else data.ram_mb
-        swap_kb = data.swap_kb[:-1] if len(data.swap_kb) > 1 else data.swap_kb
-        times = data.timestamps[:-1] if len(data.timestamps) > 1 else data.timestamps
-        batches = data.is_batch[:-1] if len(data.is_batch) > 1 else data.is_batch
-        
-        swap_mb = [s / 1024 for s in swap_kb]
+        ax = self.ax
+        ax.clear()
         
-        total_memory = [r + s for r, s in zip(ram, swap_mb)]
+        v = data.as_views
+        ram, swap_mb, batches, seconds = v.ram_mb, v.swap_mb, v.is_batch, v.seconds
         
-        start_time = times[0]
-        seconds = [(t - start_time).total_seconds() for t in times]
+        total_memory = ram + swap_mb
         
         time_data, xlabel = self._prepare_time_axis(seconds, metadata)
         
-        plt.fill_between(time_data, ram, color='blue', alpha=0.6, label='RAM')
+        ax.fill_between(time_data, ram, color='blue', alpha=0.6, label='RAM', rasterized=True)
         
-        plt.fill_between(time_data, ram, total_memory, color='orange', alpha=0.6, label='SWAP')
+        ax.fill_between(time_data, ram, total_memory, color='orange', alpha=0.6, label='SWAP', rasterized=True)
         
-        for t in time_data:
-            plt.axvline(x=t, color='navy', linestyle='-', linewidth=0.8, alpha=0.7, zorder=10)
+        self._add_vertical_lines(time_data, color='navy', linewidth=0.8, alpha=0.7, zorder=10)
         
-        for i in range(len(time_data) - 1):
-            if batches[i]:
-                plt.fill_between(time_data[i:i+2], 0, [total_memory[i], total_memory[i+1]], 
-                               color='black', alpha=0.15, linewidth=0)
+        if len(time_data) > 1:
+            seg_time, seg_total, seg_batch = self._split_segments(time_data, total_memory, batches)
+            ax.fill_between(seg_time, 0, seg_total, where=seg_batch,
+                           color='black', alpha=0.15, linewidth=0, rasterized=True)
         
         if data.init_events_with_swap:
             self._add_init_markers_with_swap(data.init_events_with_swap, metadata)
         
         if data.max_ram_peak_mb > 0 and metadata.component == 'ttp' and metadata.variant == 'HHE':
-            self._add_peak_marker(data, start_time, time_data, times, metadata)
+            self._add_peak_marker(data, time_data, seconds, metadata)
         
         self._configure_graph(
             f"{metadata.component.upper()} {'Hybrid' if metadata.variant == 'HHE' else 'Plain'} - Stacked RAM + SWAP Usage Over Time",
             xlabel, "Memory Usage (MB)"
         )
         
-        plt.legend(loc='upper left', fontsize=10)
+        ax.legend(loc='upper left', fontsize=10)
         
-        plt.ylim(bottom=0)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_ylim(bottom=0)
+        self.fig.savefig(output_path, dpi=300, pil_kwargs={'compress_level': 1})
     
     # Generates and saves a stacked area graph showing RAM and SWAP together with boundary lines for clarity.
     def plot_ram_swap_stacked(self, data: MemoryData, metadata: FileMetadata, output_path: str):
-        plt.figure(figsize=(12, 6))
+        ax = self.ax
+        ax.clear()
         
-        ram_mb = data.ram_mb[:-1] if len(data.ram_mb) > 1 else data.ram_mb
-        swap_kb = data.swap_kb[:-1] if len(data.swap_kb) > 1 else data.swap_kb
-        times = data.timestamps[:-1] if len(data.timestamps) > 1 else data.timestamps
-        batches = data.is_batch[:-1] if len(data.is_batch) > 1 else data.is_batch
+        v = data.as_views
+        ram_mb, swap_mb, seconds = v.ram_mb, v.swap_mb, v.seconds
         
-        swap_mb = [s / 1024 for s in swap_kb]
-        
-        start_time = times[0]
-        seconds = [(t - start_time).total_seconds() for t in times]
         time_data, xlabel = self._prepare_time_axis(seconds, metadata)
         
-        plt.fill_between(time_data, 0, ram_mb, color='blue', alpha=0.6, label='RAM')
+        ax.fill_between(time_data, 0, ram_mb, color='blue', alpha=0.6, label='RAM', rasterized=True)
         
-        total_memory = [ram + swap for ram, swap in zip(ram_mb, swap_mb)]
-        plt.fill_between(time_data, ram_mb, total_memory, color='orange', alpha=0.6, label='SWAP')
+        total_memory = ram_mb + swap_mb
+        ax.fill_between(time_data, ram_mb, total_memory, color='orange', alpha=0.6, label='SWAP', rasterized=True)
         
-        plt.plot(time_data, ram_mb, color='blue', linewidth=1, alpha=0.8)
-        plt.plot(time_data, total_memory, color='darkorange', linewidth=1, alpha=0.8)
+        ax.plot(time_data, ram_mb, color='blue', linewidth=1, alpha=0.8)
+        ax.plot(time_data, total_memory, color='darkorange', linewidth=1, alpha=0.8)
         
         if data.init_events:
             self._add_init_markers(data.init_events)
         
         if (data.max_ram_peak_mb > 0 and metadata.component == 'ttp' 
             and metadata.variant == 'HHE'):
-            self._add_peak_marker(data, start_time, time_data, times, metadata)
+            self._add_peak_marker(data, time_data, seconds, metadata)
         
-        plt.legend(loc='upper left', fontsize=10)
+        ax.legend(loc='upper left', fontsize=10)
         
         self._configure_graph(
             f"{metadata.component.upper()} {'Hybrid' if metadata.variant == 'HHE' else 'Plain'} - RAM + SWAP Usage (Stacked)",
             xlabel, "Memory Usage (MB)"
         )
         
-        plt.ylim(bottom=0)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_ylim(bottom=0)
+        self.fig.savefig(output_path, dpi=300, pil_kwargs={'compress_level': 1})
     
     # Scales the time axis values and returns the appropriate unit label based on the component and Pi type.
-    def _prepare_time_axis(self, seconds: List[float], 
-                          metadata: FileMetadata) -> Tuple[List, str]:
+    def _prepare_time_axis(self, seconds: np.ndarray, 
+                          metadata: FileMetadata) -> Tuple[np.ndarray, str]:
         if metadata.component == 'server':
-            time_data = [s / 3600 for s in seconds]
-            return time_data, 'Time (Hours)'
+            return seconds / 3600, 'Time (Hours)'
         
         if self.pi_type == "zero":
-            time_data = []
-            for s in seconds:
-                if s <= 50:
-                    time_data.append(s * 2 / 50)
-                else:
-                    time_data.append(2 + (s - 50) / 5)
+            time_data = np.where(seconds <= 50, seconds * 2 / 50, 2 + (seconds - 50) / 5)
             return time_data, 'Time'
         
         return seconds, 'Time (Seconds)'
@@ -375,7 +375,7 @@ class GraphPlotter:
             else:
                 continue
             
-            plt.axhline(y=ram_mb, color=color, linestyle=style, linewidth=2.5, 
+            self.ax.axhline(y=ram_mb, color=color, linestyle=style, linewidth=2.5, 
                        alpha=0.9, zorder=10)
     
     # Draws horizontal lines on a stacked graph at the combined RAM+SWAP height for each initialization event.
@@ -393,58 +393,73 @@ class GraphPlotter:
             else:
                 continue
             
-            plt.axhline(y=total_mb, color=color, linestyle=style, linewidth=2.5, 
+            self.ax.axhline(y=total_mb, color=color, linestyle=style, linewidth=2.5, 
                        alpha=0.9, zorder=10)
     
     # Draws a red dashed line on TTP HHE graphs indicating the peak RAM value reached.
-    def _add_peak_marker(self, data: MemoryData, start_time: datetime,
-                        time_data: List, timestamps: List, metadata: FileMetadata):
-        peak_seconds = (data.peak_timestamp - start_time).total_seconds()
+    def _add_peak_marker(self, data: MemoryData, time_data: np.ndarray,
+                        seconds: np.ndarray, metadata: FileMetadata):
+        peak_seconds = (np.datetime64(data.peak_timestamp, 'us') - data.timestamps[0]) / np.timedelta64(1, 's')
         
         if metadata.component == 'server':
             peak_time = peak_seconds / 3600
         else:
             peak_time = peak_seconds
         
-        peak_index = None
-        for i, ts in enumerate(timestamps[:-1]):
-            ts_seconds = (ts - start_time).total_seconds()
-            ts_time = ts_seconds / 3600 if metadata.component == 'server' else ts_seconds
-            if ts_time >= peak_time:
-                peak_index = i
-                break
+        peak_index = int(np.searchsorted(seconds[:-1], peak_seconds, side='left'))
         
-        if peak_index is not None and peak_index > 0:
+        if 0 < peak_index < len(seconds) - 1:
             start_x = time_data[peak_index - 1]
-            plt.plot([start_x, peak_time], [data.max_ram_peak_mb, data.max_ram_peak_mb],
+            self.ax.plot([start_x, peak_time], [data.max_ram_peak_mb, data.max_ram_peak_mb],
                     color='red', linestyle='--', linewidth=2, alpha=0.8)
     
+    # Draws full-height vertical lines at every time value as a single line collection.
+    def _add_vertical_lines(self, time_data: np.ndarray, color: str, linewidth: float,
+                           alpha: float, zorder: int):
+        ax = self.ax
+        segments = np.zeros((len(time_data), 2, 2))
+        segments[:, :, 0] = np.asarray(time_data)[:, np.newaxis]
+        segments[:, 1, 1] = 1
+        ax.add_collection(LineCollection(segments, colors=color, linestyles='-', linewidths=linewidth,
+                                         alpha=alpha, zorder=zorder, transform=ax.get_xaxis_transform()),
+                          autolim=False)
+    
+    # Repeats interior points so that each segment between two samples can be masked by its starting sample's batch flag.
+    def _split_segments(self, time_data: np.ndarray, values: np.ndarray,
+                        is_batch: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        seg_time = np.repeat(time_data, 2)[1:-1]
+        seg_values = np.repeat(values, 2)[1:-1]
+        seg_batch = np.repeat(is_batch[:-1], 2)
+        return seg_time, seg_values, seg_batch
+    
     # Fills the graph background with color, using higher opacity during batch processing periods.
-    def _fill_background(self, time_data: List, values: List, 
-                        is_batch: List, color: str):
-        for i in range(len(time_data) - 1):
-            alpha = 0.5 if is_batch[i] else 0.3
-            plt.fill_between(time_data[i:i+2], values[i:i+2], 
-                           alpha=alpha, color=color)
+    def _fill_background(self, time_data: np.ndarray, values: np.ndarray, 
+                        is_batch: np.ndarray, color: str):
+        if len(time_data) < 2:
+            return
+        
+        seg_time, seg_values, seg_batch = self._split_segments(time_data, values, is_batch)
+        self.ax.fill_between(seg_time, seg_values, where=seg_batch, alpha=0.5, color=color, rasterized=True)
+        self.ax.fill_between(seg_time, seg_values, where=~seg_batch, alpha=0.3, color=color, rasterized=True)
     
-    # Applies standard title, axis labels, grid, and layout settings to the current graph.
+    # Applies standard title, axis labels, grid, and layout settings to the shared axes.
     def _configure_graph(self, title: str, xlabel: str, ylabel: str):
-        plt.title(title, fontsize=14, fontweight='bold')
-        plt.xlabel(xlabel, fontsize=12)
-        plt.ylabel(ylabel, fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.xlim(left=0)
-        plt.tight_layout()
+        self.ax.set_title(title, fontsize=14, fontweight='bold')
+        self.ax.set_xlabel(xlabel, fontsize=12)
+        self.ax.set_ylabel(ylabel, fontsize=12)
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_xlim(left=0)
+
+
+# Returns the metadata fields encoded in a memory log filename, or None if it does not match; cached across directory scans.
+@lru_cache(maxsize=4096)
+def _parse_filename(filename: str) -> Optional[Tuple[str, ...]]:
+    match = _FILENAME_RE.search(filename)
+    return match.groups() if match else None
 
 
 class FileFinder:
     
-    FILENAME_PATTERN = (
-        r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_'
-        r'(HHE|HE)_BatchNr:(\d+)_BatchSize:(\d+)_IntSize:(\d+)_'
-        r'(client|server|ttp)_(HHE|HE)'
-    )
-    
     # Scans a directory for memory log files and returns the most recent file per component/variant pair.
     def find_latest_files(self, data_dir: str) -> Dict[str, FileMetadata]:
         if not os.path.exists(data_dir):
@@ -456,11 +471,11 @@ class FileFinder:
             if not filename.endswith('.txt'):
                 continue
             
-            match = re.search(self.FILENAME_PATTERN, filename)
-            if not match:
+            fields = _parse_filename(filename)
+            if not fields:
                 continue
             
-            timestamp, variant, batch_nr, batch_size, int_size, component, _ = match.groups()
+            timestamp, variant, batch_nr, batch_size, int_size, component, _ = fields
             
             metadata = FileMetadata(
                 component=component,
@@ -483,6 +498,34 @@ class FileFinder:
         return latest_files
 
 
+# Parses one memory log and writes its graph; runs in a worker process and returns the progress report for the component.
+def _process_one(metadata: FileMetadata, run_dir: str, pi_type: str) -> str:
+    key = f"{metadata.component}_{metadata.variant}"
+    lines = [f"Processing: {key} ({metadata.timestamp})"]
+    
+    data = LogParser().parse(metadata.filepath)
+    
+    if len(data.timestamps) == 0:
+        lines.append(f"  Warning: No valid data\n")
+        return "\n".join(lines)
+    
+    plotter = GraphPlotter(pi_type)
+    try:
+        if metadata.component == 'client' and metadata.variant == 'HE':
+            stacked_path = os.path.join(run_dir, f"{key}_stacked.png")
+            plotter.plot_stacked_ram_swap(data, metadata, stacked_path)
+            lines.append(f"  ✓ Stacked RAM+SWAP graph")
+        else:
+            ram_path = os.path.join(run_dir, f"{key}_ram.png")
+            plotter.plot_ram(data, metadata, ram_path)
+            lines.append(f"  ✓ RAM graph")
+    finally:
+        plotter.close()
+    
+    lines.append("")
+    return "\n".join(lines)
+
+
 class MemoryGraphAnalyzer:
     
     # Initializes the analyzer with input/output directories, Pi type, and sets up all required sub-components.
@@ -496,8 +539,6 @@ class MemoryGraphAnalyzer:
         self.run_dir = os.path.join(output_dir, timestamp)
         os.makedirs(self.run_dir, exist_ok=True)
         
-        self.parser = LogParser()
-        self.plotter = GraphPlotter(pi_type)
         self.finder = FileFinder()
     
     # Runs the full analysis pipeline by finding, parsing, and plotting memory graphs for all log files.
@@ -514,27 +555,12 @@ class MemoryGraphAnalyzer:
         
         print(f"Found {len(files)} components\n")
         
-        for key, metadata in files.items():
-            print(f"Processing: {key} ({metadata.timestamp})")
-            
-            data = self.parser.parse(metadata.filepath)
-            
-            if not data.timestamps:
-                print(f"  Warning: No valid data\n")
-                continue
-            
-            base_name = f"{metadata.component}_{metadata.variant}"
-            
-            if metadata.component == 'client' and metadata.variant == 'HE':
-                stacked_path = os.path.join(self.run_dir, f"{base_name}_stacked.png")
-                self.plotter.plot_stacked_ram_swap(data, metadata, stacked_path)
-                print(f"  ✓ Stacked RAM+SWAP graph")
-            else:
-                ram_path = os.path.join(self.run_dir, f"{base_name}_ram.png")
-                self.plotter.plot_ram(data, metadata, ram_path)
-                print(f"  ✓ RAM graph")
-            
-            print()
+        max_workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_process_one, metadata, self.run_dir, self.pi_type)
+                       for metadata in files.values()]
+            for future in as_completed(futures):
+                print(future.result())
         
         print(f"Complete! Graphs saved to: {self.run_dir}")
 
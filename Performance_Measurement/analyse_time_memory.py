@@ -2,9 +2,96 @@
 
 import os
 import re
+import sys
+from array import array
 from datetime import datetime
-from typing import Dict, List
-from collections import defaultdict
+from typing import Dict, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+
+_FILENAME_RE = re.compile(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_(HHE|HE)_BatchNr:(\d+)_BatchSize:(\d+)_IntSize:(\d+)_(client|server|ttp)_(HHE|HE)')
+_TS_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+')
+_SWAP_RE = re.compile(r'SWAP: (\d+) kB')
+_RAM_PEAK_RE = re.compile(r'RAM Peak: (\d+) kB')
+_RAM_RE = re.compile(r'RAM: (\d+) kB')
+_SEP100 = "=" * 100
+_DASH100 = "-" * 100
+_CATEGORY_ORDER = ('Batch', 'Batch Transmission', 'Integer', 'Encryption', 'Transciphering', 'Decryption')
+_CATEGORY_RE = re.compile(
+    r'(?=.*?(?P<Encryption>encryption|kreyvium))'
+    r'|(?=.*?(?P<Decryption>decryption))'
+    r'|(?=.*?(?P<Transciphering>transciphering))'
+    r'|(?=.*?(?P<BatchTransmission>batch transmission))'
+    r'|(?=.*?(?P<Batch>batch))'
+    r'|(?=.*?(?P<Integer>integer))'
+    r'|(?=.*?(?P<Initialization>initialized))',
+    re.IGNORECASE | re.DOTALL
+)
+_CATEGORY_NAMES = {'BatchTransmission': 'Batch Transmission'}
+
+
+# Splits a "timestamp : event" line into its two parts with str.partition; only the short timestamp part is checked against the regex.
+def _split_event(line: str):
+    timestamp, separator, event = line.partition(' : ')
+    if not separator or not event or not _TS_RE.fullmatch(timestamp):
+        return None
+    
+    return timestamp, event
+
+
+# Creates the per-category accumulators: one array per operation metric, durations in seconds and memory values in kB.
+def _new_category_arrays() -> Dict[str, array]:
+    return {
+        'duration': array('d'),
+        'ram_diff': array('q'),
+        'swap_diff': array('q'),
+        'ram_peak': array('q')
+    }
+
+
+# Maps an operation name to the category of the first matching keyword alternative, falling back to the name itself; cached per distinct name.
+@lru_cache(maxsize=1024)
+def _categorize(op_name: str) -> str:
+    match = _CATEGORY_RE.match(op_name)
+    if not match:
+        return op_name
+    
+    return _CATEGORY_NAMES.get(match.lastgroup, match.lastgroup)
+
+
+# Formats a whole number of seconds as hours/minutes/seconds; cached because the report repeats the same durations.
+@lru_cache(maxsize=1024)
+def _format_time(total_seconds: int) -> str:
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    secs = total_seconds % 60
+    return f"({hours} h {minutes} m {secs} s)"
+
+
+# Formats a kilobyte value as megabytes and kilobytes; cached because the report repeats the same values.
+@lru_cache(maxsize=1024)
+def _format_memory(kb: float) -> str:
+    return f"{kb / 1024.0:.2f} MB ({kb:.0f} kB)"
+
+
+# Asks the kernel to start reading a log file into the page cache so the disk I/O overlaps with parsing of earlier pairs.
+def _prefetch(filepath: str):
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class AnalyseTimeMemory:
@@ -19,7 +106,7 @@ class AnalyseTimeMemory:
         if not os.path.exists(self.analysis_dir):
             os.makedirs(self.analysis_dir)
     
-    # Scans the time and memory directories for matching file pairs and returns them grouped by component and variant.
+    # Scans the time and memory directories for matching file pairs and returns the newest pair for each component and variant.
     def get_matching_files(self) -> Dict[str, Dict[str, str]]:
         file_pairs = {}
         
@@ -27,25 +114,28 @@ class AnalyseTimeMemory:
             print(f"Warning: Directory {self.data_time_dir} does not exist.")
             return file_pairs
         
-        for filename in os.listdir(self.data_time_dir):
-            if not filename.endswith(".txt"):
-                continue
-            
-            memory_file = os.path.join(self.data_memory_dir, filename)
-            if os.path.exists(memory_file):
-                match = re.search(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_(HHE|HE)_BatchNr:(\d+)_BatchSize:(\d+)_IntSize:(\d+)_(client|server|ttp)_(HHE|HE)', filename)
+        memory_files = set(os.listdir(self.data_memory_dir)) if os.path.isdir(self.data_memory_dir) else set()
+        
+        with os.scandir(self.data_time_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith(".txt") or filename not in memory_files or not entry.is_file():
+                    continue
+                
+                match = _FILENAME_RE.search(filename)
                 
                 if match:
                     timestamp, variant, batch_nr, batch_size, int_size, component, _ = match.groups()
                     
                     key = f"{component}_{variant}"
                     
-                    if key not in file_pairs:
-                        file_pairs[key] = []
+                    newest = file_pairs.get(key)
+                    if newest is not None and timestamp <= newest['timestamp']:
+                        continue
                     
-                    file_pairs[key].append({
-                        'time_file': os.path.join(self.data_time_dir, filename),
-                        'memory_file': memory_file,
+                    file_pairs[key] = {
+                        'time_file': entry.path,
+                        'memory_file': os.path.join(self.data_memory_dir, filename),
                         'filename': filename,
                         'timestamp': timestamp,
                         'variant': variant,
@@ -53,10 +143,11 @@ class AnalyseTimeMemory:
                         'batch_size': int(batch_size),
                         'int_size': int(int_size),
                         'component': component
-                    })
+                    }
         
-        for key in file_pairs:
-            file_pairs[key].sort(key=lambda x: x['timestamp'], reverse=True)
+        for file_info in file_pairs.values():
+            _prefetch(file_info['time_file'])
+            _prefetch(file_info['memory_file'])
         
         return file_pairs
     
@@ -72,123 +163,65 @@ class AnalyseTimeMemory:
         if " : " in op_name:
             op_name = op_name.split(" : ")[0].strip()
         
-        return op_name
+        return sys.intern(op_name)
     
     # Maps an operation name to a predefined category based on keywords in the name.
     def categorize_operation(self, op_name: str) -> str:
-        op_lower = op_name.lower()
-        
-        if "encryption" in op_lower or "kreyvium" in op_lower:
-            return "Encryption"
-        elif "decryption" in op_lower:
-            return "Decryption"
-        elif "transciphering" in op_lower:
-            return "Transciphering"
-        elif "batch transmission" in op_lower:
-            return "Batch Transmission"
-        elif "batch" in op_lower:
-            return "Batch"
-        elif "integer" in op_lower:
-            return "Integer"
-        elif "initialized" in op_lower:
-            return "Initialization"
-        else:
-            return op_name
-    
-    # Parses a time log file and returns structured data containing operations with their start and end timestamps.
-    def parse_time_file(self, filepath: str) -> Dict:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        data = {'operations': [], 'initialization': None}
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) : (.+)$', line)
-            if not timestamp_match:
-                continue
-            
-            timestamp_str = timestamp_match.group(1)
-            event = timestamp_match.group(2)
-            timestamp = datetime.fromisoformat(timestamp_str)
-            
-            if "initialized" in event.lower():
-                data['initialization'] = {'timestamp': timestamp}
-            elif " Start" in event:
-                op_name = self.extract_operation_name(event)
-                data['operations'].append({
-                    'name': op_name,
-                    'category': self.categorize_operation(op_name),
-                    'start_time': timestamp
-                })
-            elif " End" in event:
-                op_name = self.extract_operation_name(event)
-                for op in reversed(data['operations']):
-                    if op['name'] == op_name and 'end_time' not in op:
-                        op['end_time'] = timestamp
-                        break
-        
-        return data
+        return _categorize(op_name)
     
-    # Parses a memory log file and returns structured data containing operations with their start and end memory snapshots.
-    def parse_memory_file(self, filepath: str) -> Dict:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        data = {'operations': [], 'initialization': None}
+    # Parses a memory log into the snapshot after initialization and the start/end snapshots of completed operations, queued per name in completion order.
+    def parse_memory_snapshots(self, filepath: str) -> Dict:
+        data = {'initialization': None, 'snapshots': {}, 'count': 0}
+        snapshots = data['snapshots']
         current_timestamp = None
         current_memory = {}
         current_event = None
+        open_ops = {}
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) : (.+)$', line)
-            if timestamp_match:
-                current_timestamp = timestamp_match.group(1)
-                current_event = timestamp_match.group(2)
-                current_memory = {}
-                continue
-            
-            if current_timestamp:
-                if "SWAP:" in line:
-                    match = re.search(r'SWAP: (\d+) kB', line)
-                    if match:
-                        current_memory['swap'] = int(match.group(1))
-                elif "RAM Peak:" in line:
-                    match = re.search(r'RAM Peak: (\d+) kB', line)
-                    if match:
-                        current_memory['ram_peak'] = int(match.group(1))
-                elif "RAM:" in line and "Peak" not in line:
-                    match = re.search(r'RAM: (\d+) kB', line)
-                    if match:
-                        current_memory['ram'] = int(match.group(1))
-                        
-                        if current_event and "initialized" in current_event.lower():
-                            data['initialization'] = current_memory.copy()
-                        elif current_event and " Start" in current_event:
-                            op_name = self.extract_operation_name(current_event)
-                            data['operations'].append({
-                                'name': op_name,
-                                'category': self.categorize_operation(op_name),
-                                'start_memory': current_memory.copy()
-                            })
-                        elif current_event and " End" in current_event:
-                            op_name = self.extract_operation_name(current_event)
-                            for op in reversed(data['operations']):
-                                if op['name'] == op_name and 'end_memory' not in op:
-                                    op['end_memory'] = current_memory.copy()
-                                    break
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as file:
+            for line in file:
+                line = line.rstrip()
+                if not line:
+                    continue
+                
+                split = _split_event(line)
+                if split:
+                    current_timestamp, current_event = split
+                    current_memory = {}
+                    continue
+                
+                if current_timestamp:
+                    if "SWAP:" in line:
+                        match = _SWAP_RE.search(line)
+                        if match:
+                            current_memory['swap'] = int(match.group(1))
+                    elif "RAM Peak:" in line:
+                        match = _RAM_PEAK_RE.search(line)
+                        if match:
+                            current_memory['ram_peak'] = int(match.group(1))
+                    elif "RAM:" in line and "Peak" not in line:
+                        match = _RAM_RE.search(line)
+                        if match:
+                            current_memory['ram'] = int(match.group(1))
+                            
+                            if current_event and "initialized" in current_event.lower():
+                                data['initialization'] = current_memory
+                            elif current_event and " Start" in current_event:
+                                op_name = self.extract_operation_name(current_event)
+                                open_ops.setdefault(op_name, []).append(current_memory)
+                                data['count'] += 1
+                            elif current_event and " End" in current_event:
+                                op_name = self.extract_operation_name(current_event)
+                                pending = open_ops.get(op_name)
+                                if pending:
+                                    snapshots.setdefault(op_name, deque()).append((pending.pop(), current_memory))
         
         return data
     
-    # Combines parsed time and memory data with file metadata into a unified metrics dictionary grouped by operation category.
-    def calculate_metrics(self, time_data: Dict, memory_data: Dict, metadata: Dict) -> Dict:
+    # Streams the time log of a file pair and folds every completed operation, with the memory snapshots of the same name, straight into per-category metrics.
+    def analyse_pair(self, metadata: Dict) -> Dict:
+        memory_data = self.parse_memory_snapshots(metadata['memory_file'])
+        
         metrics = {
             'component': metadata['component'],
             'variant': metadata['variant'],
@@ -197,10 +230,12 @@ class AnalyseTimeMemory:
             'int_size': metadata['int_size'],
             'filename': metadata['filename'],
             'initialization': {},
-            'operations_by_category': defaultdict(list)
+            'operations_by_category': defaultdict(_new_category_arrays),
+            'time_operations': 0,
+            'memory_operations': memory_data['count']
         }
         
-        if memory_data.get('initialization'):
+        if memory_data['initialization']:
             init_mem = memory_data['initialization']
             metrics['initialization'] = {
                 'swap': init_mem.get('swap', 0),
@@ -208,35 +243,58 @@ class AnalyseTimeMemory:
                 'ram_peak': init_mem.get('ram_peak', 0)
             }
         
-        for time_op in time_data['operations']:
-            if 'start_time' not in time_op or 'end_time' not in time_op:
-                continue
-            
-            duration = (time_op['end_time'] - time_op['start_time']).total_seconds()
-            
-            mem_op = next((m for m in memory_data['operations'] 
-                          if m['name'] == time_op['name'] and 'start_memory' in m and 'end_memory' in m), None)
-            
-            op_metrics = {
-                'duration': duration,
-                'ram_diff': 0,
-                'swap_diff': 0,
-                'ram_peak': 0
-            }
-            
-            if mem_op:
-                op_metrics['ram_diff'] = mem_op['end_memory'].get('ram', 0) - mem_op['start_memory'].get('ram', 0)
-                op_metrics['swap_diff'] = mem_op['end_memory'].get('swap', 0) - mem_op['start_memory'].get('swap', 0)
-                op_metrics['ram_peak'] = mem_op['end_memory'].get('ram_peak', 0)
-            
-            category = time_op['category']
-            metrics['operations_by_category'][category].append(op_metrics)
+        snapshots = memory_data['snapshots']
+        operations_by_category = metrics['operations_by_category']
+        open_ops = {}
+        
+        with open(metadata['time_file'], 'r', encoding='utf-8', buffering=1 << 20) as file:
+            for line in file:
+                line = line.rstrip()
+                if not line:
+                    continue
+                
+                split = _split_event(line)
+                if not split:
+                    continue
+                
+                timestamp_str, event = split
+                
+                if "initialized" in event.lower():
+                    continue
+                elif " Start" in event:
+                    op_name = self.extract_operation_name(event)
+                    start_time = datetime.fromisoformat(timestamp_str)
+                    open_ops.setdefault(op_name, []).append((start_time, self.categorize_operation(op_name)))
+                    metrics['time_operations'] += 1
+                elif " End" in event:
+                    op_name = self.extract_operation_name(event)
+                    pending = open_ops.get(op_name)
+                    if not pending:
+                        continue
+                    
+                    end_time = datetime.fromisoformat(timestamp_str)
+                    start_time, category = pending.pop()
+                    
+                    ram_diff = swap_diff = ram_peak = 0
+                    mem_ops = snapshots.get(op_name)
+                    if mem_ops:
+                        start_memory, end_memory = mem_ops.popleft()
+                        ram_diff = end_memory.get('ram', 0) - start_memory.get('ram', 0)
+                        swap_diff = end_memory.get('swap', 0) - start_memory.get('swap', 0)
+                        ram_peak = end_memory.get('ram_peak', 0)
+                    
+                    category_arrays = operations_by_category[category]
+                    category_arrays['duration'].append((end_time - start_time).total_seconds())
+                    category_arrays['ram_diff'].append(ram_diff)
+                    category_arrays['swap_diff'].append(swap_diff)
+                    category_arrays['ram_peak'].append(ram_peak)
         
         return metrics
     
-    # Computes average duration, RAM diff, swap diff, and peak RAM across a list of operation metric dictionaries.
-    def calculate_averages(self, operations: List[Dict]) -> Dict:
-        if not operations:
+    # Computes average duration, RAM diff, swap diff, and peak RAM from the per-metric arrays of one operation category.
+    def calculate_averages(self, operations: Dict[str, array]) -> Dict:
+        count = len(operations['duration'])
+        if not count:
             return {
                 'count': 0,
                 'avg_duration': 0,
@@ -246,90 +304,67 @@ class AnalyseTimeMemory:
             }
         
         return {
-            'count': len(operations),
-            'avg_duration': sum(op['duration'] for op in operations) / len(operations),
-            'avg_ram_diff': sum(op['ram_diff'] for op in operations) / len(operations),
-            'avg_swap_diff': sum(op['swap_diff'] for op in operations) / len(operations),
-            'max_ram_peak': max(op['ram_peak'] for op in operations)
+            'count': count,
+            'avg_duration': sum(operations['duration']) / count,
+            'avg_ram_diff': sum(operations['ram_diff']) / count,
+            'avg_swap_diff': sum(operations['swap_diff']) / count,
+            'max_ram_peak': max(operations['ram_peak'])
         }
     
     # Converts a duration in seconds to a human-readable hours/minutes/seconds string.
     def format_time(self, seconds: float) -> str:
-        total_seconds = int(seconds)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        secs = total_seconds % 60
-        return f"({hours} h {minutes} m {secs} s)"
-    
-    # Converts a memory value from kilobytes to megabytes.
-    def kb_to_mb(self, kb: float) -> float:
-        return kb / 1024.0
+        return _format_time(int(seconds))
     
     # Formats a memory value in kilobytes as a string showing both megabytes and kilobytes.
     def format_memory(self, kb: float) -> str:
-        mb = self.kb_to_mb(kb)
-        return f"{mb:.2f} MB ({kb:.0f} kB)"
+        return _format_memory(kb)
     
-    # Generates a formatted performance report string from a list of metrics grouped by component and variant.
-    def generate_report(self, all_metrics: List[Dict]) -> str:
+    # Generates a formatted performance report string from metrics keyed by component and variant.
+    def generate_report(self, all_metrics: Dict[str, Dict]) -> str:
         report = []
-        report.append("=" * 100)
-        report.append("PERFORMANCE ANALYSIS")
-        report.append("=" * 100)
-        report.append("")
-        
-        grouped = {}
-        for metrics in all_metrics:
-            key = f"{metrics['component']}_{metrics['variant']}"
-            if key not in grouped:
-                grouped[key] = metrics
-        
-        for key, metrics in sorted(grouped.items()):
-            report.append(f"\n{'=' * 100}")
-            report.append(f"COMPONENT: {metrics['component'].upper()} | VARIANT: {metrics['variant']}")
-            report.append(f"{'=' * 100}")
-            report.append(f"Source file: {metrics['filename']}")
-            report.append(f"Batch count: {metrics['batch_nr']} | Batch size: {metrics['batch_size']} | Integer size: {metrics['int_size']} bit")
-            report.append("")
+        add = report.append
+        add(_SEP100)
+        add("PERFORMANCE ANALYSIS")
+        add(_SEP100)
+        add("")
+        
+        for key, metrics in sorted(all_metrics.items()):
+            add("\n" + _SEP100)
+            add(f"COMPONENT: {metrics['component'].upper()} | VARIANT: {metrics['variant']}")
+            add(_SEP100)
+            add(f"Source file: {metrics['filename']}")
+            add(f"Batch count: {metrics['batch_nr']} | Batch size: {metrics['batch_size']} | Integer size: {metrics['int_size']} bit")
+            add("")
             
             if metrics['initialization']:
-                report.append("AFTER INITIALIZATION:")
-                report.append("-" * 100)
+                add("AFTER INITIALIZATION:")
+                add(_DASH100)
                 init = metrics['initialization']
-                report.append(f"SWAP: {self.format_memory(init['swap'])}")
-                report.append(f"RAM: {self.format_memory(init['ram'])}")
-                report.append(f"RAM Peak: {self.format_memory(init['ram_peak'])}")
-                report.append("")
+                add(f"SWAP: {self.format_memory(init['swap'])}")
+                add(f"RAM: {self.format_memory(init['ram'])}")
+                add(f"RAM Peak: {self.format_memory(init['ram_peak'])}")
+                add("")
             
-            report.append("OPERATION AVERAGES:")
-            report.append("-" * 100)
+            add("OPERATION AVERAGES:")
+            add(_DASH100)
             
-            category_order = [
-                'Batch',
-                'Batch Transmission',
-                'Integer',
-                'Encryption',
-                'Transciphering',
-                'Decryption'
-            ]
-            
-            for category in category_order:
-                if category in metrics['operations_by_category']:
-                    ops = metrics['operations_by_category'][category]
-                    avg = self.calculate_averages(ops)
-                    
-                    if avg['count'] > 0:
-                        report.append(f"\n{category} Average (n={avg['count']}):")
-                        report.append(f"   Time diff: {avg['avg_duration']:.6f} s {self.format_time(avg['avg_duration'])}")
-                        report.append(f"   SWAP diff: {self.format_memory(avg['avg_swap_diff'])}")
-                        report.append(f"   RAM diff: {self.format_memory(avg['avg_ram_diff'])}")
-                        report.append(f"   RAM Peak: {self.format_memory(avg['max_ram_peak'])}")
+            for category in _CATEGORY_ORDER:
+                ops = metrics['operations_by_category'].get(category)
+                if not ops:
+                    continue
+                
+                avg = self.calculate_averages(ops)
+                add(f"\n{category} Average (n={avg['count']}):")
+                add(f"   Time diff: {avg['avg_duration']:.6f} s {self.format_time(avg['avg_duration'])}")
+                add(f"   SWAP diff: {self.format_memory(avg['avg_swap_diff'])}")
+                add(f"   RAM diff: {self.format_memory(avg['avg_ram_diff'])}")
+                add(f"   RAM Peak: {self.format_memory(avg['max_ram_peak'])}")
             
-            report.append("")
+            add("")
         
-        report.append("=" * 100)
-        report.append("END OF ANALYSIS")
-        report.append("=" * 100)
+        add(_SEP100)
+        add("END OF ANALYSIS")
+        add(_SEP100)
         
         return "\n".join(report)
     
@@ -345,20 +380,16 @@ class AnalyseTimeMemory:
         
         print(f"Found components: {len(file_pairs)}")
         
-        all_metrics = []
+        all_metrics = {}
         
-        for key, files_list in file_pairs.items():
-            file_info = files_list[0]
-            print(f"\nAnalyzing: {key} | {file_info['timestamp']}")
-            
-            time_data = self.parse_time_file(file_info['time_file'])
-            memory_data = self.parse_memory_file(file_info['memory_file'])
-            
-            print(f"  Found {len(time_data['operations'])} time operations")
-            print(f"  Found {len(memory_data['operations'])} memory operations")
-            
-            metrics = self.calculate_metrics(time_data, memory_data, file_info)
-            all_metrics.append(metrics)
+        keys = list(file_pairs)
+        max_workers = min(len(keys), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_analyze_pair, [self] * len(keys), keys,
+                                   [file_pairs[key] for key in keys])
+            for key, (progress, metrics) in zip(keys, results):
+                print(progress)
+                all_metrics[key] = metrics
         
         report = self.generate_report(all_metrics)
         
@@ -375,6 +406,19 @@ class AnalyseTimeMemory:
         return output_path
 
 
+# Analyses one time/memory file pair in a worker process and returns the progress report with the metrics.
+def _analyze_pair(analyser: AnalyseTimeMemory, key: str, file_info: Dict) -> Tuple[str, Dict]:
+    metrics = analyser.analyse_pair(file_info)
+    
+    progress = "\n".join([
+        f"\nAnalyzing: {key} | {file_info['timestamp']}",
+        f"  Found {metrics['time_operations']} time operations",
+        f"  Found {metrics['memory_operations']} memory operations"
+    ])
+    
+    return progress, metrics
+
+
 if __name__ == "__main__":
     analyser = AnalyseTimeMemory()
     analyser.run_analysis()
\ No newline at end of file